@@ -0,0 +1,102 @@
+import argparse
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent
+
+IMPORT_SNIPPET = """
+import time
+start = time.perf_counter()
+import server
+imported = time.perf_counter()
+server.create_app()
+created = time.perf_counter()
+print(imported - start, created - imported)
+"""
+
+SERVE_SNIPPET = """
+import sys
+from server import create_app
+create_app().run(host='127.0.0.1', port=int(sys.argv[1]))
+"""
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def measure_import():
+    """Returns (import seconds, create_app seconds) from a fresh interpreter"""
+    output = subprocess.check_output(
+        [sys.executable, '-c', IMPORT_SNIPPET],
+        cwd=BACKEND_DIR,
+        stderr=subprocess.DEVNULL,
+        text=True
+    )
+    import_time, create_time = output.strip().splitlines()[-1].split()
+    return float(import_time), float(create_time)
+
+def measure_first_response(use_gunicorn, timeout):
+    """Returns seconds from process launch until GET / answers 200"""
+    port = free_port()
+    if use_gunicorn:
+        command = [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py',
+                   '--bind', f'127.0.0.1:{port}']
+    else:
+        command = [sys.executable, '-c', SERVE_SNIPPET, str(port)]
+
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        command,
+        cwd=BACKEND_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            if process.poll() is not None:
+                raise RuntimeError(f"Server exited with code {process.returncode}")
+            try:
+                with urllib.request.urlopen(f'http://127.0.0.1:{port}/', timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start
+            except OSError:
+                time.sleep(0.01)
+        raise RuntimeError(f"No successful response within {timeout} seconds")
+    finally:
+        process.terminate()
+        process.wait()
+
+def report(label, samples):
+    print(f"{label}: median {statistics.median(samples) * 1000:.1f} ms, "
+          f"min {min(samples) * 1000:.1f} ms, max {max(samples) * 1000:.1f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure backend cold start time")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--gunicorn', action='store_true',
+                        help="serve with gunicorn.conf.py instead of the Flask dev server")
+    parser.add_argument('--timeout', type=float, default=30)
+    args = parser.parse_args()
+
+    import_samples = []
+    create_samples = []
+    response_samples = []
+    for _ in range(args.runs):
+        import_time, create_time = measure_import()
+        import_samples.append(import_time)
+        create_samples.append(create_time)
+        response_samples.append(measure_first_response(args.gunicorn, args.timeout))
+
+    print(f"Python {sys.version.split()[0]}, {args.runs} runs")
+    report("import server", import_samples)
+    report("create_app()", create_samples)
+    report("first successful response", response_samples)
+
+if __name__ == "__main__":
+    main()
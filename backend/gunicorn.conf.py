@@ -0,0 +1,21 @@
+import multiprocessing
+import os
+
+# Start with: gunicorn -c gunicorn.conf.py
+wsgi_app = 'server:create_app()'
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+timeout = 30
+
+# Build the app once in the master and fork workers from it, so each worker
+# starts with Flask and the SDKs already imported
+preload_app = True
+
+def on_starting(server):
+    from server import warm_imports
+    warm_imports()
+
+def post_fork(server, worker):
+    # Each worker opens its own connections
+    from server import reset_clients
+    reset_clients()
@@ -1,41 +1,76 @@
-from flask import Flask, jsonify, request
-import requests
-from dotenv import load_dotenv
+from flask import Blueprint, Flask, current_app, jsonify, request
 import os
 from pathlib import Path
-from flask_cors import CORS
 from urllib.parse import urlencode
-from itinerary_generator import generate_itinerary
 from datetime import datetime
-import openai
 from functools import lru_cache
-from datetime import timedelta
 
-app = Flask(__name__)
-CORS(app, resources={
-    r"/*": {
-        "origins": "*",
-        "methods": ["GET", "POST", "OPTIONS"],
-        "max_age": 3600,
-        "timeout": 30
-    }
-})
+# Heavy third-party packages (openai, requests, flask_cors, dotenv) are
+# imported inside the functions that need them so that importing this module
+# stays cheap. Routes live on a blueprint and the app is built by create_app().
+api = Blueprint('api', __name__)
 
 # Look for .env file in the parent directory (root of project)
 env_path = Path(__file__).parent.parent / '.env'
-load_dotenv(env_path)
 
-GOOGLE_PLACES_API_KEY = os.getenv('GOOGLE_PLACES_API_KEY')
-ACCUWEATHER_API_KEY = os.getenv('ACCUWEATHER_API_KEY')
+def create_app():
+    """
+    Builds the Flask app
+    - Loads API keys from the project .env file into app.config
+    - Registers CORS and the API routes
+    - Run with `gunicorn -c gunicorn.conf.py` or `python server.py`
+    """
+    from dotenv import load_dotenv
+    from flask_cors import CORS
+
+    load_dotenv(env_path)
+
+    app = Flask(__name__)
+    app.config['GOOGLE_PLACES_API_KEY'] = os.getenv('GOOGLE_PLACES_API_KEY')
+    app.config['ACCUWEATHER_API_KEY'] = os.getenv('ACCUWEATHER_API_KEY')
+    app.config['OPENAI_API_KEY'] = os.getenv('OPENAI_API_KEY')
+
+    if not app.config['GOOGLE_PLACES_API_KEY'] or not app.config['OPENAI_API_KEY']:
+        print("Warning: Missing API keys!")
+        print("GOOGLE_PLACES_API_KEY:", "Present" if app.config['GOOGLE_PLACES_API_KEY'] else "Missing")
+        print("OPENAI_API_KEY:", "Present" if app.config['OPENAI_API_KEY'] else "Missing")
+
+    CORS(app, resources={
+        r"/*": {
+            "origins": "*",
+            "methods": ["GET", "POST", "OPTIONS"],
+            "max_age": 3600,
+            "timeout": 30
+        }
+    })
+    app.register_blueprint(api)
+    return app
+
+def warm_imports():
+    """
+    Imports the heavy SDKs without creating any clients
+    - Called in the gunicorn master so forked workers share the loaded modules
+    - Clients are still created lazily inside each worker
+    """
+    import openai  # noqa: F401
+    import requests  # noqa: F401
+
+@lru_cache(maxsize=None)
+def get_http_session():
+    """Returns a process-wide requests session so connections are reused."""
+    import requests
+    return requests.Session()
 
-# Set your OpenAI API key
-openai.api_key = os.getenv('OPENAI_API_KEY')
+@lru_cache(maxsize=None)
+def get_openai_client(api_key):
+    """Returns a process-wide OpenAI client for the given key."""
+    import openai
+    return openai.OpenAI(api_key=api_key)
 
-# Add this near the top of your file, after setting the API keys
-if not GOOGLE_PLACES_API_KEY or not openai.api_key:
-    print("Warning: Missing API keys!")
-    print("GOOGLE_PLACES_API_KEY:", "Present" if GOOGLE_PLACES_API_KEY else "Missing")
-    print("OPENAI_API_KEY:", "Present" if openai.api_key else "Missing")
+def reset_clients():
+    """Drops cached clients, e.g. after forking so sockets aren't shared."""
+    get_http_session.cache_clear()
+    get_openai_client.cache_clear()
 
 # Cache the weather data for 1 hour
 @lru_cache(maxsize=100)
@@ -46,18 +81,19 @@ def get_cached_weather(latitude, longitude, timestamp):
     - Then gets 5-day forecast for that location
     - Caches results to avoid hitting API limits
     """
-    if not ACCUWEATHER_API_KEY:
+    accuweather_api_key = current_app.config['ACCUWEATHER_API_KEY']
+    if not accuweather_api_key:
         raise Exception("AccuWeather API key not configured")
         
     try:
         # First, get the location key using coordinates
         location_url = f"http://dataservice.accuweather.com/locations/v1/cities/geoposition/search"
         location_params = {
-            'apikey': ACCUWEATHER_API_KEY,
+            'apikey': accuweather_api_key,
             'q': f"{latitude},{longitude}",
         }
         
-        location_response = requests.get(location_url, params=location_params)
+        location_response = get_http_session().get(location_url, params=location_params)
         if location_response.status_code != 200:
             raise Exception(f"AccuWeather API error: {location_response.text}")
             
@@ -70,11 +106,11 @@ def get_cached_weather(latitude, longitude, timestamp):
         # Then, get the forecast
         forecast_url = f"http://dataservice.accuweather.com/forecasts/v1/daily/5day/{location_key}"  # Changed to 5-day forecast
         forecast_params = {
-            'apikey': ACCUWEATHER_API_KEY,
+            'apikey': accuweather_api_key,
             'metric': 'true'
         }
         
-        forecast_response = requests.get(forecast_url, params=forecast_params)
+        forecast_response = get_http_session().get(forecast_url, params=forecast_params)
         if forecast_response.status_code != 200:
             raise Exception(f"Forecast API error: {forecast_response.text}")
             
@@ -112,14 +148,15 @@ def get_cached_weather(latitude, longitude, timestamp):
     except Exception as e:
         raise Exception(f"Failed to fetch weather data: {str(e)}")
 
-@app.route('/api/nearby-attractions/<float:latitude>/<float:longitude>/<int:radius>')
+@api.route('/api/nearby-attractions/<float:latitude>/<float:longitude>/<int:radius>')
 def get_nearby_attractions(latitude, longitude, radius):
     """
     Uses Google Places API to find tourist attractions near given coordinates
     - Takes latitude, longitude and search radius as parameters
     - Returns list of attractions with details like name, rating, etc.
     """
-    if not GOOGLE_PLACES_API_KEY:
+    google_places_api_key = current_app.config['GOOGLE_PLACES_API_KEY']
+    if not google_places_api_key:
         return jsonify({"error": "Google Places API key not configured"}), 500
     
     # Default radius if not specified or invalid
@@ -133,11 +170,11 @@ def get_nearby_attractions(latitude, longitude, radius):
         'location': f"{latitude},{longitude}",
         'radius': radius,
         'type': place_type,
-        'key': GOOGLE_PLACES_API_KEY
+        'key': google_places_api_key
     }
     
     try:
-        response = requests.get(url, params=params)
+        response = get_http_session().get(url, params=params)
         data = response.json()
         
         if 'results' not in data:
@@ -157,21 +194,22 @@ def get_nearby_attractions(latitude, longitude, radius):
         print(f"Error: {str(e)}")
         return jsonify([])
 
-@app.route('/api/place-details/<place_id>')
+@api.route('/api/place-details/<place_id>')
 def get_place_details(place_id):
-    if not GOOGLE_PLACES_API_KEY:
+    google_places_api_key = current_app.config['GOOGLE_PLACES_API_KEY']
+    if not google_places_api_key:
         return jsonify({"error": "Google Places API key not configured"}), 500
     
     url = "https://maps.googleapis.com/maps/api/place/details/json"
     params = {
         'place_id': place_id,
         'fields': 'photos,reviews',  # Request specific fields
-        'key': GOOGLE_PLACES_API_KEY
+        'key': google_places_api_key
     }
     
     try:
         # Get details from Google Places API
-        response = requests.get(url, params=params)
+        response = get_http_session().get(url, params=params)
         data = response.json()
         
         if 'result' not in data:
@@ -187,7 +225,7 @@ def get_place_details(place_id):
                 photo_params = {
                     'maxwidth': 800,
                     'photo_reference': photo['photo_reference'],
-                    'key': GOOGLE_PLACES_API_KEY
+                    'key': google_places_api_key
                 }
                 photos.append(f"{photo_url}?{urlencode(photo_params)}")
         
@@ -201,7 +239,7 @@ def get_place_details(place_id):
         print(f"Error: {str(e)}")
         return jsonify({})
 
-@app.route('/api/generate-itinerary', methods=['POST'])
+@api.route('/api/generate-itinerary', methods=['POST'])
 def generate_itinerary():
     """
     Uses OpenAI API to generate a smart itinerary
@@ -209,7 +247,8 @@ def generate_itinerary():
     - Gets weather forecast for the location
     - Generates an itinerary considering weather and preferences
     """
-    if not openai.api_key:
+    openai_api_key = current_app.config['OPENAI_API_KEY']
+    if not openai_api_key:
         return jsonify({"error": "OpenAI API key not configured"}), 500
 
     data = request.json
@@ -284,7 +323,7 @@ Example:
 - 15 min walk to next location"""
 
     try:
-        client = openai.OpenAI()
+        client = get_openai_client(openai_api_key)
         response = client.chat.completions.create(
             model="gpt-3.5-turbo",
             messages=[
@@ -316,7 +355,7 @@ Example:
         print(f"Error generating itinerary: {str(e)}")
         return jsonify({"error": "Failed to generate itinerary"}), 500
 
-@app.route('/api/weather/<float:latitude>/<float:longitude>')
+@api.route('/api/weather/<float:latitude>/<float:longitude>')
 def get_weather_forecast(latitude, longitude):
     """
     Gets weather forecast for a location
@@ -336,14 +375,14 @@ def get_weather_forecast(latitude, longitude):
         print(f"Error fetching weather data: {str(e)}")
         return jsonify({"error": str(e)}), 500
 
-@app.route('/')
+@api.route('/')
 def test():
     return jsonify({"message": "Server is running!"})
 
-@app.after_request
+@api.after_app_request
 def after_request(response):
     response.headers.add('Access-Control-Max-Age', '3600')
     return response
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True) 
\ No newline at end of file
+    create_app().run(host='0.0.0.0', port=5000, debug=True) 
\ No newline at end of file